@@ -1,18 +1,29 @@
 # asr-service/main.py
 import os
-import tempfile
+import asyncio
+import hashlib
+import re
 import logging
-import requests
-import whisper
-from fastapi import FastAPI, UploadFile, File, HTTPException
+import functools
+import anyio
+import httpx
+import orjson
+import ctranslate2
+from cachetools import TTLCache
+from langid.langid import LanguageIdentifier, model as langid_model
+from faster_whisper import WhisperModel, BatchedInferencePipeline, decode_audio
+from fastapi import FastAPI, UploadFile, File, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.formparsers import MultiPartParser
 from pydantic import BaseModel
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="ASR/AST Service", version="1.0.0")
+app = FastAPI(title="ASR/AST Service", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -26,10 +37,36 @@ app.add_middleware(
 # Configuration
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 MODEL_NAME = os.getenv("MODEL_NAME", "gemma3n:2b")
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "1h")
+WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "auto")
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "")
+# Each worker loads its own Whisper model and runs its own Ollama setup, so keep this small
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+WHISPER_CPU_THREADS = int(os.getenv("WHISPER_CPU_THREADS", str(os.cpu_count() or 0)))
+WHISPER_BATCH_SIZE = int(os.getenv("WHISPER_BATCH_SIZE", "16"))
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "8"))
+# Concurrent decodes CTranslate2 runs in parallel; further requests wait in its internal queue
+WHISPER_NUM_WORKERS = int(os.getenv("WHISPER_NUM_WORKERS", "4"))
+OLLAMA_CACHE_SIZE = int(os.getenv("OLLAMA_CACHE_SIZE", "4096"))
+OLLAMA_CACHE_TTL = int(os.getenv("OLLAMA_CACHE_TTL", "3600"))
+LANGID_MIN_CONFIDENCE = float(os.getenv("LANGID_MIN_CONFIDENCE", "0.95"))
+MIN_LLM_TEXT_LENGTH = 3
+STREAM_HEAD_CHARS = 40
+UPLOAD_SPOOL_MAX_SIZE = int(os.getenv("UPLOAD_SPOOL_MAX_SIZE", str(16 << 20)))
+
+# Uploads are spooled to a SpooledTemporaryFile; keep typical voice clips in memory
+# instead of rolling over to disk past Starlette's 1 MB default
+MultiPartParser.max_file_size = UPLOAD_SPOOL_MAX_SIZE
 
 # Global variables
 whisper_model = None
 ollama_available = False
+ollama_model_pulled = False
+ollama_setup_task = None
+
+# Ollama results keyed by a hash of the normalized input text
+_enhance_cache = TTLCache(maxsize=OLLAMA_CACHE_SIZE, ttl=OLLAMA_CACHE_TTL)
+_translate_cache = TTLCache(maxsize=OLLAMA_CACHE_SIZE, ttl=OLLAMA_CACHE_TTL)
 
 # Supported languages
 SUPPORTED_LANGUAGES = {
@@ -39,6 +76,10 @@ SUPPORTED_LANGUAGES = {
     "tr": "Turkish", "pl": "Polish", "nl": "Dutch"
 }
 
+# Fast language detection over langid's full language set, so text in a language we
+# don't translate between (e.g. Ukrainian) is never mistaken for a supported neighbour
+_language_identifier = LanguageIdentifier.from_modelstring(langid_model, norm_probs=True)
+
 # ----------------------------
 # Response Models
 # ----------------------------
@@ -65,129 +106,375 @@ class HealthResponse(BaseModel):
     status: str
     whisper_loaded: bool
     ollama_available: bool
+    ollama_model_pulled: bool
 
 class SupportedLanguagesResponse(BaseModel):
     languages: dict
 
+# The language set is static, so its response body is encoded once at import time
+SUPPORTED_LANGUAGES_JSON = orjson.dumps(SupportedLanguagesResponse(languages=SUPPORTED_LANGUAGES).model_dump())
+
 # ----------------------------
 # Startup Initialization
 # ----------------------------
 @app.on_event("startup")
 async def startup_event():
-    global whisper_model, ollama_available
+    global whisper_model, ollama_setup_task
+    app.state.http = httpx.AsyncClient(
+        base_url=OLLAMA_BASE_URL,
+        http2=True,
+        timeout=httpx.Timeout(45.0),
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    )
+    # Pulling can take minutes; do it in the background so the service is routable immediately
+    ollama_setup_task = asyncio.create_task(setup_ollama())
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
     try:
         logger.info("Loading Whisper model...")
-        whisper_model = whisper.load_model("tiny")
-        logger.info("Whisper model loaded successfully")
+        compute_type = resolve_whisper_compute_type(WHISPER_DEVICE)
+        base_model = await run_in_threadpool(
+            WhisperModel, "tiny",
+            device=WHISPER_DEVICE,
+            compute_type=compute_type,
+            cpu_threads=WHISPER_CPU_THREADS,
+            num_workers=WHISPER_NUM_WORKERS
+        )
+        whisper_model = BatchedInferencePipeline(model=base_model)
+        logger.info(f"Whisper model loaded successfully ({compute_type})")
+    except Exception as e:
+        logger.error(f"Startup error: {e}")
 
-        # Check Ollama availability
-        try:
-            response = requests.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=10)
+async def setup_ollama():
+    global ollama_available, ollama_model_pulled
+    # Check Ollama availability
+    try:
+        response = await app.state.http.get("/api/tags", timeout=10)
+        if response.status_code != 200:
+            logger.warning("Ollama service responded unexpectedly")
+            return
+        logger.info("Ollama service is reachable")
+        local_models = {model.get("name") for model in orjson.loads(response.content).get("models", [])}
+    except Exception as e:
+        logger.error(f"Could not connect to Ollama: {e}")
+        return
+
+    # Attempt to pull model, unless an earlier start (or another worker) already has it
+    try:
+        if MODEL_NAME in local_models or f"{MODEL_NAME}:latest" in local_models:
+            ollama_model_pulled = True
+            logger.info(f"Model {MODEL_NAME} already present")
+        else:
+            response = await app.state.http.post(
+                "/api/pull",
+                json={"name": MODEL_NAME, "stream": False},
+                timeout=600.0
+            )
             if response.status_code == 200:
-                ollama_available = True
-                logger.info("Ollama service is available")
-                # Attempt to pull model
-                try:
-                    requests.post(
-                        f"{OLLAMA_BASE_URL}/api/pull",
-                        json={"name": MODEL_NAME},
-                        timeout=300
-                    )
-                    logger.info(f"Model {MODEL_NAME} pull initiated")
-                except Exception as e:
-                    logger.warning(f"Could not pull model: {e}")
+                ollama_model_pulled = True
+                logger.info(f"Model {MODEL_NAME} pulled")
             else:
-                logger.warning("Ollama service responded unexpectedly")
-        except Exception as e:
-            logger.error(f"Could not connect to Ollama: {e}")
+                logger.warning(f"Model pull failed: {response.status_code}")
+    except Exception as e:
+        logger.warning(f"Could not pull model: {e}")
+
+    if not ollama_model_pulled:
+        return
+    # Only route requests to Ollama once the model is there to serve them
+    ollama_available = True
+    logger.info("Ollama service is available")
 
+    # Load the model into memory before the first real request
+    try:
+        response = await app.state.http.post(
+            "/api/generate",
+            json={
+                "model": MODEL_NAME,
+                "prompt": "hi",
+                "stream": False,
+                "keep_alive": OLLAMA_KEEP_ALIVE,
+                "options": {"num_predict": 1}
+            },
+            timeout=120.0
+        )
+        if response.status_code == 200:
+            logger.info(f"Model {MODEL_NAME} warmed up")
+        else:
+            logger.warning(f"Model warm-up failed: {response.status_code}")
     except Exception as e:
-        logger.error(f"Startup error: {e}")
+        logger.warning(f"Could not warm up model: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Stop background work before closing the client it uses
+    if ollama_setup_task is not None:
+        ollama_setup_task.cancel()
+        await asyncio.gather(ollama_setup_task, return_exceptions=True)
+    await app.state.http.aclose()
 
 # ----------------------------
 # Utility Functions
 # ----------------------------
-def transcribe_audio(audio_file: bytes) -> str:
+def resolve_whisper_compute_type(device: str) -> str:
+    if WHISPER_COMPUTE_TYPE:
+        return WHISPER_COMPUTE_TYPE
+    # int8 weights everywhere; keep float16 activations when a GPU is available
+    if device == "cuda" or (device == "auto" and ctranslate2.get_cuda_device_count() > 0):
+        return "int8_float16"
+    return "int8"
+
+def transcribe_audio(audio_file: UploadFile) -> str:
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
-            tmp_file.write(audio_file)
-            tmp_file_path = tmp_file.name
+        # Decode straight from the spooled upload to float32 mono 16 kHz, without
+        # first copying the whole file into a bytes object
+        audio_file.file.seek(0)
+        audio = decode_audio(audio_file.file, sampling_rate=16000)
 
-        result = whisper_model.transcribe(tmp_file_path)
-        os.unlink(tmp_file_path)
+        segments, _ = whisper_model.transcribe(audio, batch_size=WHISPER_BATCH_SIZE, vad_filter=True)
+        # segments is a lazy generator; decoding happens while it is consumed
+        text = " ".join(segment.text.strip() for segment in segments)
 
-        return result["text"].strip()
+        return text.strip()
     except Exception as e:
         logger.error(f"Transcription error: {e}")
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
-def enhance_text_with_ollama(text: str) -> str:
-    if not ollama_available:
-        return text
-    try:
-        prompt = f"""Please improve and correct the following transcribed text. 
+def _text_key(text: str) -> bytes:
+    normalized = " ".join(text.split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+ENHANCE_OPTIONS = {"temperature": 0.3, "top_k": 40, "top_p": 0.9, "num_predict": 200}
+TRANSLATE_OPTIONS = {"temperature": 0.3, "top_k": 40, "top_p": 0.9, "num_predict": 300}
+
+def build_enhance_prompt(text: str) -> str:
+    return f"""Please improve and correct the following transcribed text. 
 Fix grammar, punctuation, and spelling errors while maintaining the original meaning:
 
 Text: "{text}"
 
 Improved text:"""
 
-        response = requests.post(
-            f"{OLLAMA_BASE_URL}/api/generate",
-            json={
-                "model": MODEL_NAME,
-                "prompt": prompt,
-                "stream": False,
-                "options": {"temperature": 0.3, "top_k": 40, "top_p": 0.9, "num_predict": 200}
-            },
-            timeout=30
-        )
-        if response.status_code == 200:
-            enhanced = response.json().get("response", text).strip()
-            return enhanced.strip('"')
-        else:
-            logger.warning(f"Ollama enhancement failed: {response.status_code}")
+def build_translate_prompt(text: str, target_language: str, source_language: str = "auto") -> str:
+    target_lang_name = SUPPORTED_LANGUAGES.get(target_language, target_language)
+    source_lang_name = SUPPORTED_LANGUAGES.get(source_language, "auto") if source_language != "auto" else "auto-detected language"
+
+    return f"""Translate the following text from {source_lang_name} to {target_lang_name}. 
+Provide only the translation without any explanations or additional text.
+
+Text to translate: "{text}"
+
+Translation in {target_lang_name}:"""
+
+async def stream_ollama_generate(prompt: str, options: dict, timeout: float):
+    """Yield response fragments of a streaming Ollama generation as they arrive."""
+    async with app.state.http.stream(
+        "POST",
+        "/api/generate",
+        json={
+            "model": MODEL_NAME,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": OLLAMA_KEEP_ALIVE,
+            "options": options
+        },
+        timeout=timeout
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            chunk = orjson.loads(line)
+            if chunk.get("response"):
+                yield chunk["response"]
+            if chunk.get("done"):
+                break
+
+async def collect_ollama_generate(prompt: str, options: dict, timeout: float) -> str:
+    return "".join([part async for part in stream_ollama_generate(prompt, options, timeout)])
+
+def is_trivial_text(text: str) -> bool:
+    return len(text.strip()) < MIN_LLM_TEXT_LENGTH
+
+def is_in_language(text: str, language: str, source_language: str = "auto") -> bool:
+    if source_language != "auto":
+        return source_language == language
+    detected, confidence = _language_identifier.classify(text)
+    return detected == language and confidence >= LANGID_MIN_CONFIDENCE
+
+def clean_enhanced_text(text: str) -> str:
+    return text.strip().strip('"')
+
+async def enhance_text_with_ollama(text: str) -> str:
+    if not ollama_available or is_trivial_text(text):
+        return text
+    cache_key = _text_key(text)
+    cached = _enhance_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        enhanced = await collect_ollama_generate(build_enhance_prompt(text), ENHANCE_OPTIONS, timeout=30)
+        enhanced = clean_enhanced_text(enhanced)
+        if not enhanced:
             return text
+        _enhance_cache[cache_key] = enhanced
+        return enhanced
+    except httpx.HTTPStatusError as e:
+        logger.warning(f"Ollama enhancement failed: {e.response.status_code}")
+        return text
     except Exception as e:
         logger.error(f"Enhancement error: {e}")
         return text
 
-def translate_text_with_ollama(text: str, target_language: str, source_language: str = "auto") -> str:
-    if not ollama_available:
+@functools.lru_cache(maxsize=32)
+def _prefix_re(target_lang_name: str) -> re.Pattern:
+    """Match the boilerplate the model sometimes puts before a translation."""
+    return re.compile(
+        r"^(?:translation\s+in\s+\w+\s*:?|(?:translation|here\s+is\s+the\s+translation|the\s+translation\s+is|"
+        + re.escape(target_lang_name)
+        + r")\s*:)\s*",
+        re.IGNORECASE
+    )
+
+def clean_translated_text(text: str, target_lang_name: str) -> str:
+    return _prefix_re(target_lang_name).sub("", text.strip(), count=1).strip().strip('"')
+
+async def translate_text_with_ollama(text: str, target_language: str, source_language: str = "auto") -> str:
+    if not ollama_available or is_trivial_text(text) or is_in_language(text, target_language, source_language):
         return text
+    cache_key = (_text_key(text), target_language, source_language)
+    cached = _translate_cache.get(cache_key)
+    if cached is not None:
+        return cached
     try:
         target_lang_name = SUPPORTED_LANGUAGES.get(target_language, target_language)
-        source_lang_name = SUPPORTED_LANGUAGES.get(source_language, "auto") if source_language != "auto" else "auto-detected language"
+        prompt = build_translate_prompt(text, target_language, source_language)
 
-        prompt = f"""Translate the following text from {source_lang_name} to {target_lang_name}. 
-Provide only the translation without any explanations or additional text.
+        translated = await collect_ollama_generate(prompt, TRANSLATE_OPTIONS, timeout=45)
+        translated = clean_translated_text(translated, target_lang_name)
+        if not translated:
+            return text
+        _translate_cache[cache_key] = translated
+        return translated
+    except httpx.HTTPStatusError as e:
+        logger.warning(f"Ollama translation failed: {e.response.status_code}")
+        return text
+    except Exception as e:
+        logger.error(f"Translation error: {e}")
+        return text
 
-Text to translate: "{text}"
+async def stream_text_with_ollama(prompt: str, options: dict, timeout: float, fallback: str,
+                                  cache: TTLCache, cache_key, clean, prefix_re: re.Pattern = None):
+    """Stream a generation with the same cleanup and caching as the buffered helpers.
+
+    The first STREAM_HEAD_CHARS characters are held back so leading boilerplate and quotes
+    can be stripped, and trailing quotes/whitespace are held until more text follows them.
+    Cached results and the fallback text are yielded as a single chunk. If Ollama fails
+    after text has already been yielded, the error is re-raised so the caller can tell a
+    truncated stream from a finished one.
+    """
+    if not ollama_available or is_trivial_text(fallback):
+        yield fallback
+        return
+    cached = cache.get(cache_key)
+    if cached is not None:
+        yield cached
+        return
+    parts = []
+    head_sent = False
+    pending = ""
+    try:
+        async for part in stream_ollama_generate(prompt, options, timeout):
+            parts.append(part)
+            if not head_sent:
+                head = "".join(parts)
+                if len(head) < STREAM_HEAD_CHARS:
+                    continue
+                head = head.lstrip()
+                if prefix_re is not None:
+                    head = prefix_re.sub("", head, count=1)
+                part = head.lstrip().lstrip('"')
+                head_sent = True
+            chunk = pending + part
+            body = chunk.rstrip(' \t\r\n"')
+            pending = chunk[len(body):]
+            if body:
+                yield body
+    except Exception as e:
+        logger.error(f"Streaming error: {e}")
+        if head_sent:
+            raise
+        yield fallback
+        return
+    result = clean("".join(parts))
+    if not head_sent:
+        yield result or fallback
+    if result:
+        cache[cache_key] = result
+
+def sse_event(payload: dict) -> bytes:
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+async def sse_token_events(tokens):
+    """Wrap streamed tokens as events, ending with done, or with error if the stream broke."""
+    try:
+        async for token in tokens:
+            yield sse_event({"token": token})
+    except Exception:
+        yield sse_event({"error": "Generation failed before completion"})
+        return
+    yield sse_event({"done": True})
+
+async def enhance_and_translate_with_ollama(text: str, target_language: str) -> tuple:
+    """Correct and translate text in a single Ollama generation."""
+    if not ollama_available or is_trivial_text(text):
+        return text, text
+    if is_in_language(text, target_language):
+        enhanced = await enhance_text_with_ollama(text)
+        return enhanced, enhanced
+    enhanced = _enhance_cache.get(_text_key(text))
+    if enhanced is not None:
+        translated = _translate_cache.get((_text_key(enhanced), target_language, "auto"))
+        if translated is not None:
+            return enhanced, translated
+    try:
+        target_lang_name = SUPPORTED_LANGUAGES.get(target_language, target_language)
 
-Translation in {target_lang_name}:"""
+        prompt = f"""Please improve and correct the following transcribed text. 
+Fix grammar, punctuation, and spelling errors while maintaining the original meaning, then translate the corrected text to {target_lang_name}.
+Respond ONLY with JSON of the form {{"corrected": "...", "translation": "..."}}.
 
-        response = requests.post(
-            f"{OLLAMA_BASE_URL}/api/generate",
+Text: "{text}"
+
+JSON:"""
+
+        response = await app.state.http.post(
+            "/api/generate",
             json={
                 "model": MODEL_NAME,
                 "prompt": prompt,
                 "stream": False,
-                "options": {"temperature": 0.3, "top_k": 40, "top_p": 0.9, "num_predict": 300}
+                "keep_alive": OLLAMA_KEEP_ALIVE,
+                "format": "json",
+                "options": {"temperature": 0.3, "top_k": 40, "top_p": 0.9, "num_predict": 400}
             },
             timeout=45
         )
         if response.status_code == 200:
-            translated = response.json().get("response", text).strip()
-            for prefix in ["Translation:", "Translation in", f"{target_lang_name}:", "Here is the translation:", "The translation is:"]:
-                if translated.lower().startswith(prefix.lower()):
-                    translated = translated[len(prefix):].strip().lstrip(":").strip()
-            return translated.strip('"')
+            result = orjson.loads(orjson.loads(response.content).get("response", ""))
+            corrected = str(result.get("corrected") or "").strip().strip('"')
+            translation = str(result.get("translation") or "").strip().strip('"')
+            # Only cache what the model actually returned; fallbacks must not be remembered
+            enhanced = corrected or text
+            if corrected:
+                _enhance_cache[_text_key(text)] = corrected
+            if translation:
+                _translate_cache[(_text_key(enhanced), target_language, "auto")] = translation
+            return enhanced, translation or enhanced
         else:
-            logger.warning(f"Ollama translation failed: {response.status_code}")
-            return text
+            logger.warning(f"Ollama enhance+translate failed: {response.status_code}")
+            return text, text
     except Exception as e:
-        logger.error(f"Translation error: {e}")
-        return text
+        logger.error(f"Enhance+translate error: {e}")
+        return text, text
 
 # ----------------------------
 # Endpoints
@@ -202,9 +489,8 @@ async def transcribe_audio_endpoint(audio_file: UploadFile = File(...)):
     if not audio_file.content_type.startswith("audio/"):
         raise HTTPException(status_code=400, detail="File must be audio")
 
-    audio_data = await audio_file.read()
-    transcription = transcribe_audio(audio_data)
-    enhanced_text = enhance_text_with_ollama(transcription)
+    transcription = await run_in_threadpool(transcribe_audio, audio_file)
+    enhanced_text = await enhance_text_with_ollama(transcription)
     processing_time = time.time() - start_time
 
     return TranscriptionResponse(transcription=transcription, enhanced_text=enhanced_text, processing_time=processing_time)
@@ -216,7 +502,7 @@ async def translate_text_endpoint(text: str, target_language: str, source_langua
     if target_language not in SUPPORTED_LANGUAGES:
         raise HTTPException(status_code=400, detail=f"Unsupported language: {target_language}")
 
-    translated_text = translate_text_with_ollama(text, target_language, source_language)
+    translated_text = await translate_text_with_ollama(text, target_language, source_language)
     processing_time = time.time() - start_time
 
     return TranslationResponse(original_text=text, translated_text=translated_text, source_language=source_language, target_language=target_language, processing_time=processing_time)
@@ -234,10 +520,8 @@ async def transcribe_and_translate_endpoint(audio_file: UploadFile = File(...),
     if not audio_file.content_type.startswith("audio/"):
         raise HTTPException(status_code=400, detail="File must be audio")
 
-    audio_data = await audio_file.read()
-    transcription = transcribe_audio(audio_data)
-    enhanced_text = enhance_text_with_ollama(transcription)
-    translated_text = translate_text_with_ollama(enhanced_text, target_language)
+    transcription = await run_in_threadpool(transcribe_audio, audio_file)
+    enhanced_text, translated_text = await enhance_and_translate_with_ollama(transcription, target_language)
     processing_time = time.time() - start_time
 
     return ASRTranslationResponse(
@@ -248,24 +532,83 @@ async def transcribe_and_translate_endpoint(audio_file: UploadFile = File(...),
         processing_time=processing_time
     )
 
+@app.post("/transcribe/stream")
+async def transcribe_stream_endpoint(audio_file: UploadFile = File(...)):
+    if not whisper_model:
+        raise HTTPException(status_code=503, detail="Whisper model not loaded")
+
+    if not audio_file.content_type.startswith("audio/"):
+        raise HTTPException(status_code=400, detail="File must be audio")
+
+    transcription = await run_in_threadpool(transcribe_audio, audio_file)
+
+    async def events():
+        yield sse_event({"transcription": transcription})
+        prompt = build_enhance_prompt(transcription)
+        tokens = stream_text_with_ollama(
+            prompt, ENHANCE_OPTIONS, 30,
+            fallback=transcription,
+            cache=_enhance_cache,
+            cache_key=_text_key(transcription),
+            clean=clean_enhanced_text
+        )
+        async for event in sse_token_events(tokens):
+            yield event
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+@app.post("/translate/stream")
+async def translate_stream_endpoint(text: str, target_language: str, source_language: str = "auto"):
+    if target_language not in SUPPORTED_LANGUAGES:
+        raise HTTPException(status_code=400, detail=f"Unsupported language: {target_language}")
+
+    async def events():
+        if is_in_language(text, target_language, source_language):
+            yield sse_event({"token": text})
+            yield sse_event({"done": True})
+            return
+        target_lang_name = SUPPORTED_LANGUAGES[target_language]
+        prompt = build_translate_prompt(text, target_language, source_language)
+        tokens = stream_text_with_ollama(
+            prompt, TRANSLATE_OPTIONS, 45,
+            fallback=text,
+            cache=_translate_cache,
+            cache_key=(_text_key(text), target_language, source_language),
+            clean=lambda translated: clean_translated_text(translated, target_lang_name),
+            prefix_re=_prefix_re(target_lang_name)
+        )
+        async for event in sse_token_events(tokens):
+            yield event
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 @app.get("/supported-languages", response_model=SupportedLanguagesResponse)
 async def get_supported_languages():
-    return SupportedLanguagesResponse(languages=SUPPORTED_LANGUAGES)
+    return Response(content=SUPPORTED_LANGUAGES_JSON, media_type="application/json")
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    return HealthResponse(status="healthy", whisper_loaded=whisper_model is not None, ollama_available=ollama_available)
+    return HealthResponse(status="healthy", whisper_loaded=whisper_model is not None, ollama_available=ollama_available, ollama_model_pulled=ollama_model_pulled)
 
 @app.get("/models")
 async def get_available_models():
     if not ollama_available:
         return {"error": "Ollama not available"}
     try:
-        response = requests.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=10)
-        return response.json() if response.status_code == 200 else {"error": "Could not fetch models"}
+        response = await app.state.http.get("/api/tags", timeout=10)
+        return orjson.loads(response.content) if response.status_code == 200 else {"error": "Could not fetch models"}
     except Exception as e:
         return {"error": str(e)}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # A single worker serves this already-imported app; an import string would load the
+    # module (langid, CTranslate2, ...) a second time. Multiple workers need the string.
+    uvicorn.run(
+        app if WEB_CONCURRENCY == 1 else "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=WEB_CONCURRENCY,
+        loop="uvloop",
+        http="httptools"
+    )
@@ -0,0 +1,62 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import orjson
+import pytest
+
+# Make the service module importable no matter where pytest is started from
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+
+
+@pytest.fixture
+def mock_ollama(monkeypatch):
+    """Route the shared Ollama client to a fake that replays the given response chunks.
+
+    Streaming requests get one NDJSON line per chunk; non-streaming requests get the
+    chunks joined into a single response. Returns the list of requests Ollama received.
+    The caches are emptied and the client is restored after the test.
+    """
+    calls = []
+    clients = []
+
+    def install(chunks, fail_after=None):
+        def handler(request):
+            calls.append(request)
+            if not orjson.loads(request.content).get("stream"):
+                return httpx.Response(200, content=orjson.dumps({"response": "".join(chunks), "done": True}))
+            lines = [orjson.dumps({"response": chunk, "done": False}) + b"\n" for chunk in chunks]
+            if fail_after is None:
+                lines.append(orjson.dumps({"response": "", "done": True}) + b"\n")
+            return httpx.Response(200, stream=_ReplayStream(lines, fail_after))
+
+        client = httpx.AsyncClient(base_url="http://ollama", transport=httpx.MockTransport(handler))
+        clients.append(client)
+        monkeypatch.setattr(main.app.state, "http", client, raising=False)
+        return calls
+
+    monkeypatch.setattr(main, "ollama_available", True)
+    monkeypatch.setattr(main, "_enhance_cache", {})
+    monkeypatch.setattr(main, "_translate_cache", {})
+    yield install
+    for client in clients:
+        asyncio.run(client.aclose())
+
+
+class _ReplayStream(httpx.AsyncByteStream):
+    """Yield canned lines, optionally breaking the connection after the first few."""
+
+    def __init__(self, lines, fail_after=None):
+        self.lines = lines
+        self.fail_after = fail_after
+
+    async def __aiter__(self):
+        for index, line in enumerate(self.lines):
+            if self.fail_after is not None and index == self.fail_after:
+                raise httpx.ReadError("connection lost")
+            yield line
+        if self.fail_after is not None:
+            raise httpx.ReadError("connection lost")
@@ -0,0 +1,15 @@
+from main import is_in_language
+
+
+def test_same_language_is_detected():
+    assert is_in_language("Bonjour, comment allez-vous aujourd'hui ? Très bien, merci.", "fr")
+
+
+def test_near_neighbour_language_is_not_mistaken_for_target():
+    assert not is_in_language("Привіт, як справи сьогодні? Усе добре, дякую.", "ru")
+    assert not is_in_language("Goeie môre, hoe gaan dit met jou vandag?", "nl")
+
+
+def test_explicit_source_language_is_trusted():
+    assert is_in_language("anything", "de", source_language="de")
+    assert not is_in_language("anything", "de", source_language="en")
@@ -0,0 +1,27 @@
+import asyncio
+
+import orjson
+
+import main
+
+TEXT = "this is a test of the system"
+
+
+def _run_fused(mock_ollama, model_output):
+    mock_ollama([orjson.dumps(model_output).decode()])
+    return asyncio.run(main.enhance_and_translate_with_ollama(TEXT, "fr"))
+
+
+def test_fused_call_caches_both_results(mock_ollama):
+    result = _run_fused(mock_ollama, {"corrected": "This is a test of the system.", "translation": "Ceci est un test."})
+
+    assert result == ("This is a test of the system.", "Ceci est un test.")
+    assert main._translate_cache == {(main._text_key("This is a test of the system."), "fr", "auto"): "Ceci est un test."}
+
+
+def test_fused_call_does_not_cache_missing_translation(mock_ollama):
+    result = _run_fused(mock_ollama, {"corrected": "This is a test of the system."})
+
+    assert result == ("This is a test of the system.", "This is a test of the system.")
+    assert main._enhance_cache
+    assert not main._translate_cache
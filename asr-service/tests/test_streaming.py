@@ -0,0 +1,40 @@
+import orjson
+from fastapi.testclient import TestClient
+
+import main
+
+CHUNKS = ["Translation", ": ", '"Bon', "jour, comment ", "allez-vous ", "aujourd'hui", ' ?"', "\n"]
+PARAMS = {"text": "Hello, how are you doing today?", "target_language": "fr", "source_language": "en"}
+
+
+def _events(response):
+    return [orjson.loads(line[len("data: "):]) for line in response.text.split("\n\n") if line]
+
+
+def test_translate_stream_matches_buffered_cleanup(mock_ollama):
+    calls = mock_ollama(CHUNKS)
+    client = TestClient(main.app)
+
+    events = _events(client.post("/translate/stream", params=PARAMS))
+    streamed = "".join(event["token"] for event in events if "token" in event)
+
+    assert streamed == "Bonjour, comment allez-vous aujourd'hui ?"
+    assert events[-1] == {"done": True}
+
+    # Second request is served from the cache as a single event, without calling Ollama
+    events = _events(client.post("/translate/stream", params=PARAMS))
+    assert events == [{"token": streamed}, {"done": True}]
+    assert len(calls) == 1
+    assert client.post("/translate", params=PARAMS).json()["translated_text"] == streamed
+
+
+def test_translate_stream_reports_failure_after_first_tokens(mock_ollama):
+    mock_ollama(CHUNKS, fail_after=6)
+    client = TestClient(main.app)
+
+    events = _events(client.post("/translate/stream", params=PARAMS))
+
+    assert any("token" in event for event in events)
+    assert "error" in events[-1]
+    assert {"done": True} not in events
+    assert not main._translate_cache